@@ -2,8 +2,15 @@
 
 from typing import TYPE_CHECKING
 
+import pandas as _pd
+
 from .config import FinanceAIConfig, get_default_config
 
+# Copy-on-Write lets the pipeline stages add columns to their input frames
+# without deep-copying them first; it is already the default from pandas 3.
+if int(_pd.__version__.split(".")[0]) < 3:
+	_pd.set_option("mode.copy_on_write", True)
+
 if TYPE_CHECKING:  # pragma: no cover - imported for typing only
 	from .pipeline import AnalysisArtifacts as _AnalysisArtifacts
 
@@ -0,0 +1,149 @@
+"""On-disk memo of the dataframe stages of ``run_analysis`` keyed by their inputs."""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import importlib
+import logging
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Optional, Sequence, Tuple
+
+import joblib
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import sklearn
+
+from .anomaly_detection import AnomalyResult
+from .config import FinanceAIConfig
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIRNAME = "cache"
+# entries are a few MB each; older ones are pruned, least recently used first
+MAX_ENTRIES = 8
+# every module whose code shapes the cached frames; editing any of them
+# changes the key, so stale entries stop matching without a manual bump
+STAGE_MODULES = (
+    "config",
+    "data_loader",
+    "preprocessing",
+    "_categorize_nb",
+    "_numba",
+    "feature_engineering",
+    "anomaly_detection",
+    "_artifact_cache",
+)
+FRAME_NAMES = ("raw", "processed", "features", "anomalies")
+MODEL_FILENAME = "anomaly_model.joblib"
+
+CachedStages = Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, AnomalyResult]
+
+
+@functools.lru_cache(maxsize=None)
+def _stage_fingerprint() -> str:
+    """Digest of the stage modules' source plus the libraries that shape their output."""
+
+    digest = hashlib.blake2b(digest_size=16)
+    for name in STAGE_MODULES:
+        module = importlib.import_module(f".{name}", __package__)
+        digest.update(Path(module.__file__).read_bytes())
+    versions = (np.__version__, pd.__version__, pa.__version__, sklearn.__version__, joblib.__version__)
+    digest.update(repr(versions).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def entry_dir(sources: Sequence[Path], config: FinanceAIConfig) -> Path:
+    """Cache directory for this set of statement files under this configuration."""
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr((_stage_fingerprint(), config)).encode("utf-8"))
+    for source in sources:
+        stat = source.stat()
+        digest.update(repr((str(source), stat.st_mtime_ns, stat.st_size)).encode("utf-8"))
+    return config.processed_data_dir / CACHE_DIRNAME / digest.hexdigest()
+
+
+def load(directory: Path) -> Optional[CachedStages]:
+    """Read a stored entry back, or return ``None`` when it is missing or unreadable."""
+
+    if not directory.is_dir():
+        return None
+    try:
+        raw, processed, features, anomalies = (
+            pq.read_table(directory / f"{name}.parquet").to_pandas() for name in FRAME_NAMES
+        )
+        model = joblib.load(directory / MODEL_FILENAME)
+    except Exception:  # pragma: no cover - corrupt or partial entry
+        logger.warning("Ignoring unreadable analysis cache at %s", directory, exc_info=True)
+        return None
+    try:
+        # the mtime orders entries for eviction, so a hit marks this one as recent
+        os.utime(directory)
+    except OSError:  # pragma: no cover - evicted concurrently
+        pass
+    logger.info("Reusing cached analysis from %s", directory)
+    return raw, processed, features, AnomalyResult(dataframe=anomalies, model=model)
+
+
+def store(
+    directory: Path,
+    raw: pd.DataFrame,
+    processed: pd.DataFrame,
+    features: pd.DataFrame,
+    anomalies: AnomalyResult,
+) -> None:
+    """Write an entry atomically: readers either see all of it or none of it."""
+
+    staging: Optional[Path] = None
+    try:
+        directory.parent.mkdir(parents=True, exist_ok=True)
+        # unique per writer: dashboard sessions are threads sharing one pid
+        staging = Path(tempfile.mkdtemp(dir=directory.parent, prefix=f"{directory.name}.", suffix=".tmp"))
+        for name, frame in zip(FRAME_NAMES, (raw, processed, features, anomalies.dataframe)):
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            pq.write_table(table, staging / f"{name}.parquet", compression="zstd")
+        joblib.dump(anomalies.model, staging / MODEL_FILENAME)
+        try:
+            os.replace(staging, directory)
+        except OSError:
+            if not directory.is_dir():
+                raise
+            # a concurrent writer stored the same inputs first; its entry is equivalent
+            logger.debug("Analysis cache at %s was stored concurrently", directory)
+        _evict(directory.parent)
+    except Exception:
+        # caching is best effort: the disk may refuse it or the model may not be picklable
+        logger.warning("Could not store analysis cache at %s", directory, exc_info=True)
+    finally:
+        if staging is not None:
+            shutil.rmtree(staging, ignore_errors=True)
+
+
+def _evict(root: Path) -> None:
+    """Remove all but the ``MAX_ENTRIES`` most recently used entries under ``root``."""
+
+    entries = []
+    for path in root.iterdir():
+        # staging directories belong to writers that are still running
+        if path.suffix == ".tmp" or not path.is_dir():
+            continue
+        try:
+            entries.append((path.stat().st_mtime_ns, path))
+        except OSError:  # pragma: no cover - removed concurrently
+            continue
+    entries.sort(reverse=True)
+    for _, path in entries[MAX_ENTRIES:]:
+        logger.debug("Evicting analysis cache at %s", path)
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def clear(config: FinanceAIConfig) -> None:
+    """Delete every stored entry; the next run recomputes all stages."""
+
+    shutil.rmtree(config.processed_data_dir / CACHE_DIRNAME, ignore_errors=True)
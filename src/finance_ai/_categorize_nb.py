@@ -0,0 +1,146 @@
+"""Batch categorisation kernel compiled with Numba when it is installed."""
+
+from __future__ import annotations
+
+from typing import List, Sequence, Tuple, Union
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from ._numba import NUMBA_AVAILABLE, njit, prange
+from .config import FinanceAIConfig
+
+# the first kernel call of a process costs ~0.25s even from Numba's on-disk
+# cache (seconds when it compiles); the Aho-Corasick scan needs ~1.5us per
+# distinct description, so below this many it finishes first
+NUMBA_MIN_DISTINCT = 200_000
+
+
+def _pack_strings(values: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """Concatenate UTF-8 encoded strings into one byte buffer plus start offsets."""
+
+    encoded = [value.encode("utf-8") for value in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(chunk) for chunk in encoded], out=offsets[1:])
+    buffer = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+    return buffer, offsets
+
+
+def _arrow_strings(values: Union[pa.Array, pa.ChunkedArray]) -> Tuple[np.ndarray, np.ndarray]:
+    """Zero-copy views of an Arrow string array's UTF-8 data and offsets."""
+
+    if isinstance(values, pa.ChunkedArray):
+        values = values.combine_chunks()
+    offset_dtype = np.int64 if pa.types.is_large_string(values.type) else np.int32
+    _, offsets_buffer, data_buffer = values.buffers()
+    offsets = np.frombuffer(offsets_buffer, dtype=offset_dtype)[values.offset : values.offset + len(values) + 1]
+    data = np.frombuffer(data_buffer, dtype=np.uint8) if data_buffer is not None else np.zeros(0, dtype=np.uint8)
+    return data, offsets.astype(np.int64)
+
+
+def _match_categories(
+    text: np.ndarray,
+    text_offsets: np.ndarray,
+    keywords: np.ndarray,
+    keyword_offsets: np.ndarray,
+    bucket_keywords: np.ndarray,
+    bucket_offsets: np.ndarray,
+) -> np.ndarray:
+    """Return, per row, the lowest-ranked keyword found in it (or -1).
+
+    Keywords are ranked in category priority order and bucketed by their first
+    byte, so each text position only tests keywords that can start there.
+    """
+
+    n_rows = len(text_offsets) - 1
+    result = np.full(n_rows, -1, dtype=np.int64)
+    for row in prange(n_rows):
+        start = text_offsets[row]
+        end = text_offsets[row + 1]
+        best = len(keyword_offsets)
+        for position in range(start, end):
+            first = text[position]
+            for slot in range(bucket_offsets[first], bucket_offsets[first + 1]):
+                keyword = bucket_keywords[slot]
+                if keyword >= best:
+                    break
+                keyword_start = keyword_offsets[keyword]
+                keyword_length = keyword_offsets[keyword + 1] - keyword_start
+                if position + keyword_length > end:
+                    continue
+                matched = True
+                for offset in range(1, keyword_length):
+                    if text[position + offset] != keywords[keyword_start + offset]:
+                        matched = False
+                        break
+                if matched:
+                    best = keyword
+                    break
+            if best == 0:
+                break
+        if best < len(keyword_offsets):
+            result[row] = best
+    return result
+
+
+if NUMBA_AVAILABLE:
+    _match_categories = njit(parallel=True, cache=True)(_match_categories)
+
+
+def _categorize_distinct(
+    descriptions: pa.Array,
+    config: FinanceAIConfig,
+    lowered: bool,
+) -> np.ndarray:
+    """Category label per entry of ``descriptions``, returned as an object array."""
+
+    if descriptions.null_count or not NUMBA_AVAILABLE or len(descriptions) < NUMBA_MIN_DISTINCT:
+        labels = [
+            config.category_for_description(description, lowered=lowered)
+            for description in descriptions.to_pylist()
+        ]
+        return np.asarray(labels, dtype=object)
+
+    categories = list(config.category_keywords)
+    keyword_list = []
+    keyword_categories = []
+    for index, category in enumerate(categories):
+        for keyword in config.category_keywords[category]:
+            if keyword:
+                keyword_list.append(keyword)
+                keyword_categories.append(index)
+    keywords, keyword_offsets = _pack_strings(keyword_list)
+    first_bytes = keywords[keyword_offsets[:-1]] if keyword_list else np.zeros(0, dtype=np.uint8)
+    # stable sort keeps each bucket in ascending rank, which the kernel relies on
+    bucket_keywords = np.argsort(first_bytes, kind="stable")
+    bucket_offsets = np.zeros(257, dtype=np.int64)
+    np.cumsum(np.bincount(first_bytes, minlength=256), out=bucket_offsets[1:])
+    if not lowered:
+        descriptions = pc.utf8_lower(descriptions)
+    text, text_offsets = _arrow_strings(descriptions)
+    ranks = _match_categories(text, text_offsets, keywords, keyword_offsets, bucket_keywords, bucket_offsets)
+    # unmatched rows carry -1, which picks the trailing "Outros" label
+    keyword_labels = np.asarray([categories[index] for index in keyword_categories] + ["Outros"], dtype=object)
+    return keyword_labels[ranks]
+
+
+def categorize_descriptions(
+    descriptions: Union[Sequence[str], pa.Array, pa.ChunkedArray],
+    config: FinanceAIConfig,
+    *,
+    lowered: bool = False,
+) -> List[str]:
+    """Vectorised equivalent of ``config.category_for_description`` over many rows.
+
+    Statements repeat the same merchants over and over, so only the distinct
+    descriptions are classified and the labels are broadcast back per row.
+    """
+
+    if not isinstance(descriptions, (pa.Array, pa.ChunkedArray)):
+        descriptions = pa.array(descriptions, type=pa.string())
+    if isinstance(descriptions, pa.ChunkedArray):
+        descriptions = descriptions.combine_chunks()
+    encoded = pc.dictionary_encode(descriptions, null_encoding="encode")
+    labels = _categorize_distinct(encoded.dictionary, config, lowered)
+    return labels[encoded.indices.to_numpy()].tolist()
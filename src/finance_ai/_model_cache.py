@@ -0,0 +1,43 @@
+"""Process-wide memo of fitted models keyed by a fingerprint of their input."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Tuple, TypeVar
+
+import numpy as np
+
+T = TypeVar("T")
+
+MAX_ENTRIES = 8
+
+_entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def fingerprint(array: np.ndarray) -> str:
+    """Content hash of an array, including its shape and dtype."""
+
+    contiguous = np.ascontiguousarray(array)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr((contiguous.shape, contiguous.dtype.str)).encode("utf-8"))
+    digest.update(contiguous.tobytes())
+    return digest.hexdigest()
+
+
+def get_or_compute(key: Tuple[Hashable, ...], compute: Callable[[], T]) -> T:
+    """Return the value cached for ``key``, computing and storing it on a miss."""
+
+    with _lock:
+        if key in _entries:
+            _entries.move_to_end(key)
+            return _entries[key]
+    value = compute()
+    with _lock:
+        _entries[key] = value
+        _entries.move_to_end(key)
+        while len(_entries) > MAX_ENTRIES:
+            _entries.popitem(last=False)
+    return value
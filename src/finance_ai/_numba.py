@@ -0,0 +1,11 @@
+"""Optional Numba import shared by the compiled kernels."""
+
+from __future__ import annotations
+
+try:  # pragma: no cover - optional accelerator
+    from numba import njit, prange  # type: ignore
+except ImportError:  # pragma: no cover - callers fall back to NumPy/Python paths
+    njit = None
+    prange = range
+
+NUMBA_AVAILABLE = njit is not None
@@ -2,45 +2,104 @@
 
 from __future__ import annotations
 
+import logging
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Optional, Tuple
 
 import numpy as np
 import pandas as pd
+from joblib import parallel_backend
 from sklearn.ensemble import IsolationForest
 
+from . import _model_cache
 from .config import FinanceAIConfig, get_default_config
 
+try:  # pragma: no cover - optional GPU backend
+    import cupy  # type: ignore
+    from cuml.ensemble import IsolationForest as CumlIsolationForest  # type: ignore
+except ImportError:  # pragma: no cover - CPU-only environments
+    cupy = None
+    CumlIsolationForest = None
+
+logger = logging.getLogger(__name__)
+
+# below this size thread start-up costs more than scoring the trees sequentially
+PARALLEL_SCORING_MIN_ROWS = 1_000
+
 
 @dataclass(slots=True)
 class AnomalyResult:
     dataframe: pd.DataFrame
-    model: IsolationForest
+    model: Any
 
 
 class TransactionAnomalyDetector:
     def __init__(self, config: Optional[FinanceAIConfig] = None) -> None:
         self.config = config or get_default_config()
         params = self.config.anomaly
-        self.model = IsolationForest(
+        # backend="cuml" assumes cuML keeps sklearn's orientation (higher decision
+        # scores are more normal); its offset is normalised in _fit_and_score.
+        # Unverified here: cuML is not part of the tested install.
+        self.use_gpu = params.backend == "cuml" and CumlIsolationForest is not None
+        if params.backend == "cuml" and not self.use_gpu:
+            logger.warning("cuML backend requested but not importable; falling back to scikit-learn")
+        self.model = self._build_model()
+
+    def _build_model(self) -> Any:
+        params = self.config.anomaly
+        if self.use_gpu:
+            return CumlIsolationForest(
+                contamination=params.contamination,
+                random_state=params.random_state,
+            )
+        return IsolationForest(
             contamination=params.contamination,
             random_state=params.random_state,
+            n_jobs=params.n_jobs,
         )
 
-    def _build_feature_matrix(self, dataframe: pd.DataFrame) -> pd.DataFrame:
+    def _build_feature_matrix(self, dataframe: pd.DataFrame) -> np.ndarray:
         feature_columns = list(self.config.anomaly.feature_columns)
-        features = dataframe.reindex(columns=feature_columns)
-        features = features.replace([np.inf, -np.inf], np.nan)
-        features = features.fillna(0.0)
+        # row-major so the per-sample tree descent walks contiguous memory
+        features = np.zeros((len(dataframe), len(feature_columns)), dtype=np.float32, order="C")
+        for position, column in enumerate(feature_columns):
+            if column in dataframe.columns:
+                features[:, position] = dataframe[column].to_numpy(dtype=np.float32, na_value=0.0)
+        np.nan_to_num(features, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
         return features
 
+    def _decision_scores(self, model: Any, feature_matrix: np.ndarray) -> np.ndarray:
+        # sklearn accumulates tree depths in one (n_samples,) buffer but walks the
+        # trees sequentially unless a joblib backend asks for more workers
+        n_jobs = self.config.anomaly.n_jobs
+        if len(feature_matrix) < PARALLEL_SCORING_MIN_ROWS or n_jobs in (None, 1):
+            return model.decision_function(feature_matrix)
+        with parallel_backend("threading", n_jobs=n_jobs):
+            return model.decision_function(feature_matrix)
+
+    def _fit_and_score(self, feature_matrix: np.ndarray) -> Tuple[Any, np.ndarray]:
+        # fit_predict would score the matrix a second time; predict() is just decision_function < 0.
+        # Always a new estimator: the cache may still hold models fitted on earlier calls.
+        model = self._build_model()
+        if self.use_gpu:
+            device_matrix = cupy.asarray(feature_matrix)
+            model.fit(device_matrix)
+            scores = cupy.asnumpy(model.decision_function(device_matrix)).astype(np.float64)
+            # sklearn's decision_function is score_samples minus the contamination
+            # percentile of the training scores; re-centre the same way so the
+            # ``< 0`` cut below flags the same fraction whatever offset cuML applies
+            return model, scores - np.percentile(scores, 100 * self.config.anomaly.contamination)
+        model.fit(feature_matrix)
+        return model, self._decision_scores(model, feature_matrix)
+
     def score(self, dataframe: pd.DataFrame) -> AnomalyResult:
-        df = dataframe.copy()
-        feature_matrix = self._build_feature_matrix(df)
-        labels = self.model.fit_predict(feature_matrix)
-        scores = self.model.decision_function(feature_matrix)
-        df["anomaly_score"] = scores
-        df["is_anomaly"] = labels == -1
+        feature_matrix = self._build_feature_matrix(dataframe)
+        key = ("anomaly", _model_cache.fingerprint(feature_matrix), repr(self.config.anomaly))
+        model, scores = _model_cache.get_or_compute(key, lambda: self._fit_and_score(feature_matrix))
+        self.model = model
+        scores = scores.copy()
+        # under copy-on-write only the two new columns are allocated
+        df = dataframe.assign(anomaly_score=scores, is_anomaly=scores < 0)
         return AnomalyResult(dataframe=df, model=self.model)
 
 
@@ -2,13 +2,43 @@
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Iterable, Literal, Sequence
+from typing import Any, Dict, Iterable, Literal, Optional, Sequence, Tuple
+
+import ahocorasick
 
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
 
+# category order of the ``transaction_type`` column; position == categorical code
+TRANSACTION_TYPES: Tuple[str, ...] = ("expense", "income", "refund")
+
+
+def _build_automaton(entries: Iterable[Tuple[str, Any]]) -> Optional[ahocorasick.Automaton]:
+	"""Compile ``(keyword, value)`` pairs, keeping the first value seen per keyword."""
+
+	automaton = ahocorasick.Automaton()
+	for keyword, value in entries:
+		if keyword and keyword not in automaton:
+			automaton.add_word(keyword, value)
+	if len(automaton) == 0:
+		return None
+	automaton.make_automaton()
+	return automaton
+
+
+def _search(pattern: Optional[str], text: str) -> bool:
+	return pattern is not None and re.search(pattern, text) is not None
+
+
+def _alternation(keywords: Iterable[str]) -> Optional[str]:
+	"""Regex matching any of ``keywords`` literally; ``None`` when there are none."""
+
+	escaped = [re.escape(keyword) for keyword in keywords if keyword]
+	return "|".join(escaped) or None
+
 
 @dataclass(slots=True)
 class AnomalyConfig:
@@ -16,6 +46,8 @@ class AnomalyConfig:
 
 	contamination: float = 0.05
 	random_state: int = 42
+	n_jobs: int | None = -1
+	backend: Literal["sklearn", "cuml"] = "sklearn"
 	feature_columns: Sequence[str] = (
 		"amount",
 		"abs_amount",
@@ -341,6 +373,12 @@ class FinanceAIConfig:
 	anomaly: AnomalyConfig = field(default_factory=AnomalyConfig)
 	quality: QualityConfig = field(default_factory=QualityConfig)
 	forecast: ForecastConfig = field(default_factory=ForecastConfig)
+	_category_automaton: Optional[ahocorasick.Automaton] = field(
+		default=None,
+		init=False,
+		repr=False,
+		compare=False,
+	)
 
 	@property
 	def processed_data_dir(self) -> Path:
@@ -350,28 +388,60 @@ class FinanceAIConfig:
 		self.raw_data_dir.mkdir(parents=True, exist_ok=True)
 		self.processed_data_dir.mkdir(parents=True, exist_ok=True)
 
-	def category_for_description(self, description: str) -> str:
-		description_lower = description.lower()
-		for category, keywords in self.category_keywords.items():
-			if any(keyword in description_lower for keyword in keywords):
-				return category
-		return "Outros"
+	def _category_matcher(self) -> Optional[ahocorasick.Automaton]:
+		"""Lazily compile the category keywords; call ``reset_keyword_cache`` after editing them."""
+
+		if self._category_automaton is None:
+			self._category_automaton = _build_automaton(
+				(keyword, (priority, category))
+				for priority, (category, keywords) in enumerate(self.category_keywords.items())
+				for keyword in keywords
+			)
+		return self._category_automaton
+
+	@property
+	def income_pattern(self) -> Optional[str]:
+		return _alternation(self.income_keywords)
+
+	@property
+	def refund_pattern(self) -> Optional[str]:
+		return _alternation(self.refund_keywords)
+
+	@property
+	def subscription_pattern(self) -> Optional[str]:
+		return _alternation(self.subscription_keywords)
+
+	def compile_keyword_cache(self) -> None:
+		self._category_matcher()
+
+	def reset_keyword_cache(self) -> None:
+		self._category_automaton = None
+
+	def category_for_description(self, description: str, *, lowered: bool = False) -> str:
+		automaton = self._category_matcher()
+		if automaton is None:
+			return "Outros"
+		text = description if lowered else description.lower()
+		# categories are prioritised by declaration order, not by match position
+		best = min((value for _, value in automaton.iter(text)), default=None)
+		return best[1] if best is not None else "Outros"
 
-	def is_income(self, description: str, amount: float) -> bool:
+	def is_income(self, description: str, amount: float, *, lowered: bool = False) -> bool:
 		if amount < 0:
 			return True
-		description_lower = description.lower()
-		return any(keyword in description_lower for keyword in self.income_keywords)
+		text = description if lowered else description.lower()
+		# same alternation the vectorised preprocessing matches with Arrow
+		return _search(self.income_pattern, text)
 
-	def is_refund(self, description: str, amount: float) -> bool:
+	def is_refund(self, description: str, amount: float, *, lowered: bool = False) -> bool:
 		if amount < 0:
 			return True
-		description_lower = description.lower()
-		return any(keyword in description_lower for keyword in self.refund_keywords)
+		text = description if lowered else description.lower()
+		return _search(self.refund_pattern, text)
 
-	def is_subscription(self, description: str) -> bool:
-		description_lower = description.lower()
-		return any(keyword in description_lower for keyword in self.subscription_keywords)
+	def is_subscription(self, description: str, *, lowered: bool = False) -> bool:
+		text = description if lowered else description.lower()
+		return _search(self.subscription_pattern, text)
 
 	def iter_all_keywords(self) -> Iterable[str]:
 		for keywords in self.category_keywords.values():
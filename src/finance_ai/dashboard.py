@@ -5,7 +5,7 @@ from __future__ import annotations
 import sys
 from io import StringIO
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Sequence, Tuple
 
 import pandas as pd
 import streamlit as st  # type: ignore
@@ -16,7 +16,7 @@ if str(PROJECT_ROOT) not in sys.path:
     sys.path.append(str(PROJECT_ROOT))
 
 from finance_ai.config import FinanceAIConfig, get_default_config
-from finance_ai.pipeline import run_analysis
+from finance_ai.pipeline import AnalysisArtifacts, run_analysis
 
 
 st.set_page_config(
@@ -29,19 +29,41 @@ st.title("Painel inteligente de financas pessoais")
 st.caption("Analise automatizada de extratos de cartao de credito com IA.")
 
 
-def _read_uploaded_files(files: List) -> pd.DataFrame:
+@st.cache_resource
+def _get_config() -> FinanceAIConfig:
+    # shared by every session, so the category automaton is compiled once per process
+    cfg = get_default_config()
+    cfg.compile_keyword_cache()
+    return cfg
+
+
+@st.cache_data(show_spinner=False)
+def _read_uploaded_files(files: Sequence[Tuple[str, bytes]]) -> pd.DataFrame:
     frames: List[pd.DataFrame] = []
-    for uploaded in files:
-        buffer = StringIO(uploaded.getvalue().decode("utf-8"))
+    for name, payload in files:
+        buffer = StringIO(payload.decode("utf-8"))
         frame = pd.read_csv(buffer)
-        frame["source_file"] = uploaded.name
+        frame["source_file"] = name
         frames.append(frame)
     dataframe = pd.concat(frames, ignore_index=True)
     return dataframe
 
 
+@st.cache_data(show_spinner="Analisando...")
+def _cached_analysis(
+    uploads: Tuple[Tuple[str, bytes], ...],
+    sources: Tuple[Tuple[str, int, int], ...],
+    _config: FinanceAIConfig,
+) -> AnalysisArtifacts:
+    # keyed on the uploaded bytes and on each local file's path, mtime and size, so
+    # widget reruns reuse the result while edited statements are re-analysed
+    dataframe: Optional[pd.DataFrame] = _read_uploaded_files(uploads) if uploads else None
+    paths = [path for path, _, _ in sources]
+    return run_analysis(sources=paths or None, dataframe=dataframe, config=_config)
+
+
 def main() -> None:
-    cfg: FinanceAIConfig = get_default_config()
+    cfg: FinanceAIConfig = _get_config()
     st.sidebar.header("Fonte de dados")
     uploaded_files = st.sidebar.file_uploader(
         "Envie extratos Nubank em CSV",
@@ -53,20 +75,24 @@ def main() -> None:
         value=not uploaded_files,
     )
 
-    dataframe = None
-    sources = None
+    uploads: Tuple[Tuple[str, bytes], ...] = ()
+    sources: Tuple[Tuple[str, int, int], ...] = ()
     if uploaded_files:
-        dataframe = _read_uploaded_files(uploaded_files)
+        uploads = tuple((uploaded.name, uploaded.getvalue()) for uploaded in uploaded_files)
     elif use_local:
-        sources = [str(path) for path in cfg.raw_data_dir.glob("*.csv")]
+        local_files = sorted(cfg.raw_data_dir.glob("*.csv"))
+        stats = [path.stat() for path in local_files]
+        sources = tuple(
+            (str(path), stat.st_mtime_ns, stat.st_size) for path, stat in zip(local_files, stats)
+        )
 
-    if dataframe is None and not sources:
+    if not uploads and not sources:
         st.info(
             "Adicione arquivos CSV ou marque a opcao para usar os dados existentes em data/."
         )
         return
 
-    artifacts = run_analysis(sources=sources, dataframe=dataframe, config=cfg)
+    artifacts = _cached_analysis(uploads, sources, cfg)
 
     metrics = artifacts.insights.cashflow_metrics
     cols = st.columns(3)
@@ -85,7 +111,7 @@ def main() -> None:
     else:
         monthly_summary["month"] = pd.to_datetime(monthly_summary["month"], errors="coerce")
         monthly_view = monthly_summary.sort_values("month")
-        flagged = monthly_view.query("quality_flag == True")
+        flagged = monthly_view[monthly_view["quality_flag"].to_numpy(dtype=bool)]
         if not flagged.empty:
             parsed_months = pd.to_datetime(flagged["month"], errors="coerce")
             valid_months = parsed_months.dropna()
@@ -3,15 +3,25 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Iterable, List, Optional, Sequence
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 
 from .config import FinanceAIConfig, get_default_config
 
 logger = logging.getLogger(__name__)
 
+MAX_READER_THREADS = 8
+PARQUET_ROW_GROUP_SIZE = 256_000
+DICTIONARY_COLUMNS = ("category", "transaction_type", "merchant_clean", "source_file")
+
 
 def _resolve_sources(
     sources: Optional[Sequence[Path | str]],
@@ -30,6 +40,52 @@ def _resolve_sources(
     return resolved
 
 
+def _read_statement_with_pandas(csv_file: Path, config: FinanceAIConfig) -> pd.DataFrame:
+    frame = pd.read_csv(
+        csv_file,
+        sep=",",
+        parse_dates=[config.date_column],
+        dayfirst=False,
+        dtype={config.description_column: "string"},
+    )
+    frame[config.date_column] = pd.to_datetime(frame[config.date_column], errors="coerce")
+    frame[config.amount_column] = (
+        frame[config.amount_column]
+        .astype(str)
+        .str.replace(",", ".")
+        .astype(float)
+    )
+    return frame
+
+
+def _read_statement(csv_file: Path, config: FinanceAIConfig) -> pd.DataFrame:
+    convert_options = pacsv.ConvertOptions(
+        column_types={
+            config.date_column: pa.timestamp("ns"),
+            config.description_column: pa.string(),
+            # kept as text so both "12.34" and "12,34" parse like before
+            config.amount_column: pa.string(),
+        },
+        null_values=["", "NA", "NaN", "nan", "null"],
+        strings_can_be_null=True,
+    )
+    try:
+        table = pacsv.read_csv(
+            csv_file,
+            read_options=pacsv.ReadOptions(block_size=8 << 20),
+            convert_options=convert_options,
+        )
+        amount_index = table.schema.get_field_index(config.amount_column)
+        if amount_index >= 0:
+            # float() ignores surrounding whitespace, Arrow's cast does not
+            amounts = pc.utf8_trim_whitespace(pc.replace_substring(table.column(amount_index), ",", "."))
+            table = table.set_column(amount_index, config.amount_column, pc.cast(amounts, pa.float64()))
+    except pa.ArrowInvalid:
+        logger.info("Falling back to pandas parser for %s", csv_file)
+        return _read_statement_with_pandas(csv_file, config)
+    return table.to_pandas(types_mapper={pa.string(): pd.StringDtype()}.get)
+
+
 def load_transactions(
     sources: Optional[Sequence[Path | str]] = None,
     *,
@@ -40,33 +96,63 @@ def load_transactions(
     cfg = config or get_default_config()
     cfg.ensure_directories()
     csv_files = _resolve_sources(sources, cfg)
-    frames: List[pd.DataFrame] = []
-    for csv_file in csv_files:
+
+    def _load_one(csv_file: Path) -> pd.DataFrame:
         logger.info("Loading transactions from %s", csv_file)
-        frame = pd.read_csv(
-            csv_file,
-            sep=",",
-            parse_dates=[cfg.date_column],
-            dayfirst=False,
-            dtype={cfg.description_column: "string"},
-        )
-        frame[cfg.date_column] = pd.to_datetime(frame[cfg.date_column], errors="coerce")
+        frame = _read_statement(csv_file, cfg)
         frame[cfg.description_column] = frame[cfg.description_column].fillna("Desconhecido")
-        frame[cfg.amount_column] = (
-            frame[cfg.amount_column]
-            .astype(str)
-            .str.replace(".", ".", regex=False)
-            .str.replace(",", ".")
-            .astype(float)
-        )
         frame["source_file"] = csv_file.name
-        frames.append(frame)
-    combined = pd.concat(frames, ignore_index=True)
-    combined = combined.drop_duplicates(subset=[cfg.date_column, cfg.description_column, cfg.amount_column])
+        return frame
+
+    # Arrow parses outside the GIL, so several statements can be read at once
+    if len(csv_files) > 1:
+        with ThreadPoolExecutor(max_workers=min(MAX_READER_THREADS, len(csv_files))) as executor:
+            frames: List[pd.DataFrame] = list(executor.map(_load_one, csv_files))
+    else:
+        frames = [_load_one(csv_files[0])]
+    combined = _stack_frames(frames)
+    combined = _drop_duplicate_transactions(combined, cfg)
     combined = combined.sort_values(cfg.date_column).reset_index(drop=True)
     return combined
 
 
+def _stack_frames(frames: Sequence[pd.DataFrame]) -> pd.DataFrame:
+    """Row-bind statements by filling one preallocated array per column."""
+
+    if len(frames) == 1:
+        return frames[0].reset_index(drop=True)
+    columns = list(frames[0].columns)
+    dtypes = frames[0].dtypes
+    if any(list(frame.columns) != columns or not frame.dtypes.equals(dtypes) for frame in frames[1:]):
+        return pd.concat(frames, ignore_index=True)
+    total = sum(len(frame) for frame in frames)
+    stacked = {}
+    for column in columns:
+        dtype = dtypes[column]
+        if isinstance(dtype, np.dtype):
+            values = np.empty(total, dtype=dtype)
+            offset = 0
+            for frame in frames:
+                values[offset : offset + len(frame)] = frame[column].to_numpy()
+                offset += len(frame)
+        else:
+            # extension dtypes (e.g. string) go through the public concat path
+            values = pd.concat([frame[column] for frame in frames], ignore_index=True).array
+        stacked[column] = values
+    return pd.DataFrame(stacked, columns=columns, copy=False)
+
+
+def _drop_duplicate_transactions(dataframe: pd.DataFrame, config: FinanceAIConfig) -> pd.DataFrame:
+    """Keep the first row of each (date, description, amount) via a row hash."""
+
+    key_columns = [config.date_column, config.description_column, config.amount_column]
+    fingerprints = pd.util.hash_pandas_object(dataframe[key_columns], index=False).to_numpy()
+    _, first_rows = np.unique(fingerprints, return_index=True)
+    if len(first_rows) == len(dataframe):
+        return dataframe
+    return dataframe.iloc[np.sort(first_rows)]
+
+
 def save_processed_dataset(
     dataframe: pd.DataFrame,
     filename: str,
@@ -76,7 +162,21 @@ def save_processed_dataset(
     cfg = config or get_default_config()
     cfg.ensure_directories()
     target_path = cfg.processed_data_dir / filename
-    dataframe.to_parquet(target_path, index=False)
+    table = pa.Table.from_pandas(dataframe, preserve_index=False)
+    # repeated labels shrink to small integer codes once dictionary-encoded
+    for column in DICTIONARY_COLUMNS:
+        index = table.schema.get_field_index(column)
+        if index >= 0 and not pa.types.is_dictionary(table.schema.field(index).type):
+            table = table.set_column(index, column, pc.dictionary_encode(table.column(index)))
+    pq.write_table(
+        table,
+        target_path,
+        compression="zstd",
+        compression_level=3,
+        use_dictionary=True,
+        data_page_size=1 << 20,
+        row_group_size=PARQUET_ROW_GROUP_SIZE,
+    )
     logger.info("Processed dataset stored at %s", target_path)
     return target_path
 
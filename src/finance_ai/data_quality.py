@@ -3,15 +3,44 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
-from sklearn.pipeline import Pipeline
-from sklearn.preprocessing import RobustScaler
 from sklearn.svm import OneClassSVM
 
-from .config import FinanceAIConfig, get_default_config
+from . import _model_cache
+from .config import TRANSACTION_TYPES, FinanceAIConfig, get_default_config
+
+
+class RobustScaledOneClassSVM:
+    """One-class SVM on median/IQR-scaled features.
+
+    Equivalent to ``Pipeline([RobustScaler(), OneClassSVM()])`` on a plain
+    ndarray, without the per-step validation that dominates on a handful of
+    monthly rows.
+    """
+
+    def __init__(self, *, gamma: float | str, nu: float) -> None:
+        self.svm = OneClassSVM(gamma=gamma, nu=nu)
+        self.center_: Optional[np.ndarray] = None
+        self.scale_: Optional[np.ndarray] = None
+
+    def _scale(self, matrix: np.ndarray) -> np.ndarray:
+        return (matrix - self.center_) / self.scale_
+
+    def fit(self, matrix: np.ndarray) -> "RobustScaledOneClassSVM":
+        matrix = np.asarray(matrix, dtype=float)
+        self.center_ = np.median(matrix, axis=0)
+        q75, q25 = np.percentile(matrix, [75, 25], axis=0)
+        spread = q75 - q25
+        # same zero handling as sklearn's RobustScaler
+        self.scale_ = np.where(spread < 10 * np.finfo(spread.dtype).eps, 1.0, spread)
+        self.svm.fit(self._scale(matrix))
+        return self
+
+    def decision_function(self, matrix: np.ndarray) -> np.ndarray:
+        return self.svm.decision_function(self._scale(np.asarray(matrix, dtype=float)))
 
 
 @dataclass(slots=True)
@@ -19,7 +48,7 @@ class DataQualityResult:
     """Container for the outcome of the quality assessment."""
 
     monthly_summary: pd.DataFrame
-    model: Optional[Pipeline]
+    model: Optional[RobustScaledOneClassSVM]
     feature_names: List[str]
     threshold: float
 
@@ -30,12 +59,7 @@ class MonthlyDataQualityModel:
     def __init__(self, config: Optional[FinanceAIConfig] = None) -> None:
         self.config = config or get_default_config()
         params = self.config.quality
-        self.pipeline = Pipeline(
-            steps=[
-                ("scale", RobustScaler()),
-                ("model", OneClassSVM(gamma=params.gamma, nu=params.nu)),
-            ]
-        )
+        self.model = RobustScaledOneClassSVM(gamma=params.gamma, nu=params.nu)
         self.threshold = params.score_threshold
 
     def _ensure_month_column(self, dataframe: pd.DataFrame) -> pd.DataFrame:
@@ -47,44 +71,77 @@ class MonthlyDataQualityModel:
 
     def _build_monthly_features(self, dataframe: pd.DataFrame) -> pd.DataFrame:
         df = self._ensure_month_column(dataframe)
-        df = df.copy()
-        df["expense_value"] = np.where(df["transaction_type"] == "expense", -df["amount"], 0.0)
-        df["income_value"] = np.where(df["transaction_type"] != "expense", df["amount"], 0.0)
-        df["refund_flag"] = np.where(df["transaction_type"] == "refund", 1.0, 0.0)
-        if "is_subscription" in df.columns:
-            df["subscription_flag"] = df["is_subscription"].astype(float)
-        else:
-            df["subscription_flag"] = np.zeros(len(df), dtype=float)
-        if "is_weekend" in df.columns:
-            df["weekend_flag"] = df["is_weekend"].astype(float)
+        codes, months = pd.factorize(df["month"], sort=True)
+        rows = np.flatnonzero(codes >= 0)
+        order = rows[np.argsort(codes[rows], kind="stable")]
+        if len(order):
+            starts = np.searchsorted(codes[order], np.arange(len(months)))
         else:
-            df["weekend_flag"] = np.zeros(len(df), dtype=float)
-        if "is_anomaly" in df.columns:
-            df["anomaly_flag"] = df["is_anomaly"].astype(float)
+            starts = np.zeros(0, dtype=np.int64)
+        group_ids = codes[order]
+
+        def _column(values: np.ndarray) -> np.ndarray:
+            return np.asarray(values, dtype=float)[order]
+
+        def _flag(column: str) -> np.ndarray:
+            if column not in df.columns:
+                return np.zeros(len(order), dtype=float)
+            values = df[column]
+            if pd.api.types.is_bool_dtype(values.dtype) and not values.hasnans:
+                return _column(values.to_numpy().view(np.uint8))
+            return _column(values.to_numpy(dtype=float, na_value=np.nan))
+
+        def _sum(values: np.ndarray) -> np.ndarray:
+            return np.add.reduceat(np.where(np.isnan(values), 0.0, values), starts)
+
+        def _mean(values: np.ndarray) -> np.ndarray:
+            counts = np.add.reduceat(~np.isnan(values), starts)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                return _sum(values) / counts
+
+        def _std(values: np.ndarray) -> np.ndarray:
+            counts = np.add.reduceat(~np.isnan(values), starts)
+            deviations = values - _mean(values)[group_ids]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                variance = _sum(deviations * deviations) / (counts - 1)
+            return np.sqrt(np.where(counts > 1, variance, np.nan))
+
+        amount = df["amount"].to_numpy(dtype=float, na_value=np.nan)
+        # no-op recode when preprocessing already produced this categorical
+        type_codes = pd.Categorical(df["transaction_type"], categories=TRANSACTION_TYPES).codes
+        is_expense = type_codes == TRANSACTION_TYPES.index("expense")
+        expense_value = _column(np.where(is_expense, -amount, 0.0))
+        income_value = _column(np.where(is_expense, 0.0, amount))
+        abs_amount = _column(df["abs_amount"].to_numpy(dtype=float, na_value=np.nan))
+        refund_flag = _column(type_codes == TRANSACTION_TYPES.index("refund"))
+        missing_amount_flag = _column(df[self.config.amount_column].isna().to_numpy())
+
+        if len(starts):
+            largest_expense = np.fmax.reduceat(expense_value, starts)
+            total_transactions = np.diff(np.append(starts, len(order)))
         else:
-            df["anomaly_flag"] = np.zeros(len(df), dtype=float)
-        df["missing_amount_flag"] = df[self.config.amount_column].isna().astype(float)
-
-        monthly = (
-            df.groupby("month")
-            .agg(
-                total_transactions=("amount", "size"),
-                expense_sum=("expense_value", "sum"),
-                income_sum=("income_value", "sum"),
-                avg_expense=("expense_value", "mean"),
-                std_expense=("expense_value", "std"),
-                avg_income=("income_value", "mean"),
-                std_income=("income_value", "std"),
-                avg_abs_amount=("abs_amount", "mean"),
-                std_abs_amount=("abs_amount", "std"),
-                weekend_ratio=("weekend_flag", "mean"),
-                subscription_ratio=("subscription_flag", "mean"),
-                refund_ratio=("refund_flag", "mean"),
-                anomaly_ratio=("anomaly_flag", "mean"),
-                missing_amount_ratio=("missing_amount_flag", "mean"),
-                largest_expense=("expense_value", "max"),
-            )
-            .sort_index()
+            largest_expense = np.zeros(0, dtype=float)
+            total_transactions = np.zeros(0, dtype=np.int64)
+
+        monthly = pd.DataFrame(
+            {
+                "total_transactions": total_transactions,
+                "expense_sum": _sum(expense_value),
+                "income_sum": _sum(income_value),
+                "avg_expense": _mean(expense_value),
+                "std_expense": _std(expense_value),
+                "avg_income": _mean(income_value),
+                "std_income": _std(income_value),
+                "avg_abs_amount": _mean(abs_amount),
+                "std_abs_amount": _std(abs_amount),
+                "weekend_ratio": _mean(_flag("is_weekend")),
+                "subscription_ratio": _mean(_flag("is_subscription")),
+                "refund_ratio": _mean(refund_flag),
+                "anomaly_ratio": _mean(_flag("is_anomaly")),
+                "missing_amount_ratio": _mean(missing_amount_flag),
+                "largest_expense": largest_expense,
+            },
+            index=pd.Index(months, name="month"),
         )
         if monthly.empty:
             return monthly
@@ -94,6 +151,13 @@ class MonthlyDataQualityModel:
         monthly = monthly.fillna(0.0)
         return monthly
 
+    def _fit_and_score(self, matrix: np.ndarray) -> Tuple[RobustScaledOneClassSVM, np.ndarray]:
+        # a new estimator per fit: the cache may still hold models fitted on earlier calls
+        params = self.config.quality
+        model = RobustScaledOneClassSVM(gamma=params.gamma, nu=params.nu)
+        model.fit(matrix)
+        return model, model.decision_function(matrix)
+
     def score(self, dataframe: pd.DataFrame) -> DataQualityResult:
         monthly_features = self._build_monthly_features(dataframe)
         feature_names = list(monthly_features.columns)
@@ -112,14 +176,17 @@ class MonthlyDataQualityModel:
             summary = summary.reset_index()
             return DataQualityResult(summary, None, feature_names, self.threshold)
 
-        pipeline = self.pipeline
-        pipeline.fit(monthly_features)
-        scores = pipeline.decision_function(monthly_features)
+        matrix = monthly_features.to_numpy(dtype=float)
+        key = ("quality", tuple(feature_names), _model_cache.fingerprint(matrix), repr(params))
+        model, scores = _model_cache.get_or_compute(key, lambda: self._fit_and_score(matrix))
+        self.model = model
         summary = monthly_features.copy()
-        summary["quality_score"] = scores
-        summary["quality_flag"] = summary["quality_score"] < self.threshold
+        summary["quality_score"] = scores.copy()
+        # plain ndarray compare; bool is already one byte and the monthly
+        # features read it back through a uint8 view
+        summary["quality_flag"] = np.less(scores, self.threshold)
         summary = summary.reset_index()
-        return DataQualityResult(summary, pipeline, feature_names, self.threshold)
+        return DataQualityResult(summary, model, feature_names, self.threshold)
 
 
 def assess_data_quality(
@@ -2,10 +2,138 @@
 
 from __future__ import annotations
 
+from typing import Tuple
+
+import numpy as np
 import pandas as pd
 
+from ._numba import NUMBA_AVAILABLE, njit
 from .config import FinanceAIConfig, get_default_config
 
+_NS_PER_DAY = 86_400_000_000_000
+
+# derived model inputs are accumulated in float64 and stored at half the width
+FEATURE_DTYPE = np.float32
+
+
+def _trailing_window_sums(timestamps: np.ndarray, values: np.ndarray, days: int) -> np.ndarray:
+	"""Sum ``values`` over the trailing ``(t - days, t]`` window of each sorted timestamp.
+
+	Matches ``rolling(f"{days}D", min_periods=1).sum()``: NaN values are skipped,
+	and only windows with no observed value at all come out as NaN.
+	"""
+
+	observed = ~np.isnan(values)
+	cumulative = np.concatenate(([0.0], np.cumsum(np.where(observed, values, 0.0), dtype=np.float64)))
+	counts = np.concatenate(([0], np.cumsum(observed)))
+	left = np.searchsorted(timestamps, timestamps - days * _NS_PER_DAY, side="right")
+	sums = cumulative[1:] - cumulative[left]
+	return np.where(counts[1:] > counts[left], sums, np.nan).astype(FEATURE_DTYPE)
+
+
+def _rolling_mean_std(values: np.ndarray, window: int) -> Tuple[np.ndarray, np.ndarray]:
+	"""Trailing mean and population std over up to ``window`` values.
+
+	A single-pass sliding Welford update; unlike running sums of squares it does
+	not cancel catastrophically on constant or large-magnitude windows. As with
+	``rolling(window)``, NaN values are skipped and a window without any observed
+	value yields NaN.
+	"""
+
+	n_values = len(values)
+	mean_out = np.empty(n_values, dtype=np.float64)
+	std_out = np.empty(n_values, dtype=np.float64)
+	count = 0
+	mean = 0.0
+	m2 = 0.0
+	peak_m2 = 0.0
+	same_run = 0
+	for index in range(n_values):
+		value = values[index]
+		# count tracks the observed (non-NaN) values among the last ``window`` slots
+		if np.isnan(value):
+			same_run = 0
+		else:
+			same_run = same_run + 1 if index > 0 and value == values[index - 1] else 1
+			count += 1
+			delta = value - mean
+			mean += delta / count
+			m2 += delta * (value - mean)
+		if index >= window:
+			dropped = values[index - window]
+			if not np.isnan(dropped):
+				count -= 1
+				if count > 0:
+					delta = dropped - mean
+					mean -= delta / count
+					m2 -= delta * (dropped - mean)
+		if count == 0:
+			mean = 0.0
+			m2 = 0.0
+			peak_m2 = 0.0
+			mean_out[index] = np.nan
+			std_out[index] = np.nan
+			continue
+		peak_m2 = max(peak_m2, m2)
+		if same_run >= count:
+			# constant window: reset so removal round-off cannot leak into the std
+			mean = value
+			m2 = 0.0
+			peak_m2 = 0.0
+		elif m2 < peak_m2 * 1e-6:
+			# the spread collapsed after a level shift left the window; the removal
+			# round-off is now comparable to m2, so recompute it exactly
+			start = max(index - window + 1, 0)
+			mean = 0.0
+			for position in range(start, index + 1):
+				if not np.isnan(values[position]):
+					mean += values[position]
+			mean /= count
+			m2 = 0.0
+			for position in range(start, index + 1):
+				if not np.isnan(values[position]):
+					m2 += (values[position] - mean) ** 2
+			peak_m2 = m2
+		mean_out[index] = mean
+		std_out[index] = np.sqrt(m2 / count) if m2 > 0.0 else 0.0
+	return mean_out, std_out
+
+
+if NUMBA_AVAILABLE:
+	# same algorithm either way; Numba only removes the interpreter overhead
+	_rolling_mean_std = njit(cache=True)(_rolling_mean_std)
+
+
+def _daily_zscore(
+	timestamps: np.ndarray,
+	values: np.ndarray,
+	window: int = 30,
+	min_periods: int = 7,
+) -> np.ndarray:
+	"""Z-score of each row's daily total against the trailing ``window``-day statistics."""
+
+	if len(timestamps) == 0:
+		return np.zeros(0, dtype=FEATURE_DTYPE)
+	day_index = (timestamps // _NS_PER_DAY) - (timestamps[0] // _NS_PER_DAY)
+	# like resample("D").sum(): missing amounts add nothing to their day
+	daily = np.bincount(day_index, weights=np.where(np.isnan(values), 0.0, values))
+	mean, std = _rolling_mean_std(daily, window)
+	with np.errstate(divide="ignore", invalid="ignore"):
+		zscore = (daily - mean) / std
+	zscore[: min_periods - 1] = np.nan
+	zscore = zscore[day_index]
+	return np.where(np.isnan(zscore), 0.0, zscore).astype(FEATURE_DTYPE)
+
+
+def _calendar_month_totals(index: pd.DatetimeIndex, values: np.ndarray) -> np.ndarray:
+	"""Broadcast each calendar month's total back onto its rows."""
+
+	month_code = index.year.to_numpy() * 12 + index.month.to_numpy() - 1
+	_, inverse = np.unique(month_code, return_inverse=True)
+	# missing amounts are skipped, as resample().sum() did
+	totals = np.bincount(inverse, weights=np.where(np.isnan(values), 0.0, values))
+	return totals[inverse].astype(FEATURE_DTYPE)
+
 
 def engineer_features(
 	dataframe: pd.DataFrame,
@@ -13,28 +141,29 @@ def engineer_features(
 	config: FinanceAIConfig | None = None,
 ) -> pd.DataFrame:
 	cfg = config or get_default_config()
-	df = dataframe.copy()
-	df = df.sort_values(cfg.date_column)
+	# prepare_transactions already hands over date-ordered rows; only re-sort
+	# frames that arrive from elsewhere
+	if dataframe[cfg.date_column].is_monotonic_increasing:
+		df = dataframe.copy(deep=False)
+	else:
+		df = dataframe.sort_values(cfg.date_column)
 	df.set_index(cfg.date_column, inplace=True)
 
 	expenses = df["amount"].where(df["transaction_type"] == "expense", 0.0)
 	incomes = df["amount"].where(df["transaction_type"] != "expense", 0.0)
 
-	df["rolling_7d_spend"] = expenses.rolling("7D", min_periods=1).sum()
-	df["rolling_30d_spend"] = expenses.rolling("30D", min_periods=1).sum()
-	df["rolling_90d_spend"] = expenses.rolling("90D", min_periods=1).sum()
-	df["rolling_7d_income"] = incomes.rolling("7D", min_periods=1).sum()
-	df["rolling_30d_income"] = incomes.rolling("30D", min_periods=1).sum()
-
-	daily_expenses = expenses.resample("D").sum()
-	daily_mean = daily_expenses.rolling(window=30, min_periods=7).mean()
-	daily_std = daily_expenses.rolling(window=30, min_periods=7).std(ddof=0)
-	zscore = (daily_expenses - daily_mean) / daily_std
-	zscore = zscore.reindex(df.index, method="ffill")
-	df["daily_spend_zscore"] = zscore.fillna(0.0)
-
-	df["month_total_expense"] = expenses.resample("M").sum().reindex(df.index, method="ffill")
-	df["month_total_income"] = incomes.resample("M").sum().reindex(df.index, method="ffill")
+	timestamps = df.index.values.astype("datetime64[ns]").view("i8")
+	expense_values = expenses.to_numpy(dtype=float)
+	income_values = incomes.to_numpy(dtype=float)
+	for days in (7, 30, 90):
+		df[f"rolling_{days}d_spend"] = _trailing_window_sums(timestamps, expense_values, days)
+	for days in (7, 30):
+		df[f"rolling_{days}d_income"] = _trailing_window_sums(timestamps, income_values, days)
+
+	df["daily_spend_zscore"] = _daily_zscore(timestamps, expense_values)
+
+	df["month_total_expense"] = _calendar_month_totals(df.index, expense_values)
+	df["month_total_income"] = _calendar_month_totals(df.index, income_values)
 
 	df.reset_index(inplace=True)
 	return df
@@ -7,6 +7,7 @@ from typing import Optional
 
 import numpy as np
 import pandas as pd
+from statsmodels.tsa.forecasting.theta import ThetaModel  # type: ignore
 from statsmodels.tsa.holtwinters import ExponentialSmoothing  # type: ignore
 
 from .config import FinanceAIConfig, get_default_config
@@ -23,7 +24,7 @@ def _prepare_monthly_expenses(
     dataframe: pd.DataFrame,
     config: FinanceAIConfig,
 ) -> pd.Series:
-    expenses = dataframe.query("transaction_type == 'expense'")
+    expenses = dataframe[(dataframe["transaction_type"] == "expense").to_numpy()]
     monthly = expenses.groupby("month")[config.amount_column].sum()
     monthly = monthly.fillna(0.0)
     monthly = monthly.sort_index()
@@ -32,6 +33,26 @@ def _prepare_monthly_expenses(
     return monthly
 
 
+def _future_index(monthly_series: pd.Series, horizon: int) -> pd.DatetimeIndex:
+    return pd.date_range(
+        start=monthly_series.index[-1],
+        periods=horizon + 1,
+        freq="ME",
+    )[1:]
+
+
+def _describe_params(label: str, params: dict) -> str:
+    scalars = [
+        f"{name}={float(value):.4f}"
+        for name, value in params.items()
+        if np.ndim(value) == 0
+        and not isinstance(value, (bool, np.bool_))
+        and value is not None
+        and not pd.isna(value)
+    ]
+    return f"{label} ajustado ({', '.join(scalars)})."
+
+
 def forecast_expenses(
     dataframe: pd.DataFrame,
     *,
@@ -44,12 +65,27 @@ def forecast_expenses(
         future_index = pd.date_range(
             start=monthly_series.index[-1] if len(monthly_series) else pd.Timestamp.utcnow(),
             periods=max(cfg.forecast.horizon_months, 1) + 1,
-            freq="M",
+            freq="ME",
         )[1:]
         forecast = pd.Series(mean_value, index=future_index, name="forecast")
         return ForecastResult(history=monthly_series, forecast=forecast, model_summary="Media simples por falta de dados.")
 
     try:
+        if len(monthly_series) < 2 * cfg.forecast.seasonal_periods:
+            # Holt-Winters cannot initialise seasonals without two full cycles
+            theta = ThetaModel(
+                monthly_series.to_numpy(),
+                period=cfg.forecast.seasonal_periods,
+                deseasonalize=False,
+            ).fit()
+            future = pd.Series(
+                np.asarray(theta.forecast(cfg.forecast.horizon_months)),
+                index=_future_index(monthly_series, cfg.forecast.horizon_months),
+                name="forecast",
+            )
+            summary = _describe_params("Modelo Theta", theta.params.to_dict())
+            return ForecastResult(history=monthly_series, forecast=future, model_summary=summary)
+
         model = ExponentialSmoothing(
             monthly_series,
             trend="add",
@@ -57,21 +93,22 @@ def forecast_expenses(
             seasonal_periods=cfg.forecast.seasonal_periods,
             damped_trend=cfg.forecast.damped_trend,
         )
-        fitted = model.fit(optimized=True, use_brute=True)
+        # a single bounded quasi-Newton run from the heuristic initial values;
+        # the brute-force grid over starting points dominated the fit time
+        fitted = model.fit(optimized=True, use_brute=False, method="L-BFGS-B")
         future = fitted.forecast(cfg.forecast.horizon_months)
-        summary = fitted.summary().as_text() if hasattr(fitted, "summary") else "Modelo Holt-Winters ajustado."
+        summary = _describe_params("Modelo Holt-Winters", fitted.params)
         future.name = "forecast"
         return ForecastResult(history=monthly_series, forecast=future, model_summary=summary)
     except Exception as exc:  # best-effort fallback
         mean_value = monthly_series.mean()
-        future_index = pd.date_range(
-            start=monthly_series.index[-1],
-            periods=cfg.forecast.horizon_months + 1,
-            freq="M",
-        )[1:]
-        forecast = pd.Series(mean_value, index=future_index, name="forecast")
+        forecast = pd.Series(
+            mean_value,
+            index=_future_index(monthly_series, cfg.forecast.horizon_months),
+            name="forecast",
+        )
         return ForecastResult(
             history=monthly_series,
             forecast=forecast,
-            model_summary=f"Holt-Winters falhou ({exc}); utilizando media.",
+            model_summary=f"Previsao falhou ({exc}); utilizando media.",
         )
\ No newline at end of file
@@ -5,6 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Dict, List, Optional
 
+import numpy as np
 import pandas as pd
 
 from .config import FinanceAIConfig, get_default_config
@@ -27,36 +28,46 @@ class InsightReport:
     anomaly_table: pd.DataFrame
 
 
-def _build_category_breakdown(df: pd.DataFrame) -> pd.DataFrame:
-    expenses = df.query("transaction_type == 'expense'")
+def _build_category_breakdown(expenses: pd.DataFrame) -> pd.DataFrame:
     breakdown = (
-        expenses.groupby("category")["amount"].sum().abs().sort_values(ascending=False)
+        expenses.groupby("category", observed=True)["amount"].sum().abs().sort_values(ascending=False)
     )
     breakdown = breakdown.reset_index().rename(columns={"amount": "total"})
     return breakdown
 
 
-def _find_recurring_merchants(df: pd.DataFrame) -> pd.DataFrame:
-    expenses = df.query("transaction_type == 'expense'")
-    grouped = expenses.groupby("merchant_clean").agg(
-        total_amount=("amount", lambda x: -x.sum()),
+def _find_recurring_merchants(expenses: pd.DataFrame) -> pd.DataFrame:
+    grouped = expenses.groupby("merchant_clean", observed=True).agg(
+        total_amount=("amount", "sum"),
         transactions=("amount", "count"),
         last_payment=("date", "max"),
     )
-    recurring = grouped.query("transactions >= 3").sort_values("total_amount", ascending=False)
+    # negate after the Cython sum instead of calling back into Python per group
+    grouped["total_amount"] = -grouped["total_amount"]
+    recurring = grouped[grouped["transactions"].to_numpy() >= 3]
+    recurring = recurring.sort_values("total_amount", ascending=False)
     return recurring.reset_index()
 
 
-def _cashflow_metrics(df: pd.DataFrame, cfg: FinanceAIConfig) -> Dict[str, float]:
-    total_expense = -df.query("transaction_type == 'expense' ")[cfg.amount_column].sum()
-    total_income = df.query("transaction_type != 'expense'")[cfg.amount_column].sum()
-    net_cashflow = total_income - total_expense
-    average_daily_spend = (
-        -df.query("transaction_type == 'expense'")
-        .groupby("date_only")[cfg.amount_column]
-        .sum()
-        .mean()
+def _cashflow_metrics(
+    df: pd.DataFrame,
+    expenses: pd.DataFrame,
+    expense_mask: np.ndarray,
+    cfg: FinanceAIConfig,
+) -> Dict[str, float]:
+    amounts = df[cfg.amount_column].to_numpy(dtype=float)
+    # one weighted pass buckets every row into [non-expense, expense] totals
+    income_sum, expense_sum = np.bincount(
+        expense_mask.astype(np.intp),
+        weights=np.where(np.isnan(amounts), 0.0, amounts),
+        minlength=2,
     )
+    total_expense = -expense_sum
+    total_income = income_sum
+    net_cashflow = total_income - total_expense
+    # mean of the per-day sums is the expense total over the distinct days
+    expense_days = expenses["date_only"].nunique()
+    average_daily_spend = total_expense / expense_days if expense_days else np.nan
     return {
         "total_expense": float(total_expense),
         "total_income": float(total_income),
@@ -66,7 +77,7 @@ def _cashflow_metrics(df: pd.DataFrame, cfg: FinanceAIConfig) -> Dict[str, float
 
 
 def _build_highlights(
-    df: pd.DataFrame,
+    anomalies: pd.DataFrame,
     breakdown: pd.DataFrame,
     metrics: Dict[str, float],
     forecast: ForecastResult,
@@ -86,14 +97,14 @@ def _build_highlights(
         highlights.append(
             f"Gasto previsto para o proximo mes: R$ {next_month:.2f}."
         )
-    anomalies = df.query("is_anomaly == True")
     if not anomalies.empty:
-        highlight_amt = -anomalies.groupby("merchant_clean")["amount"].sum().abs().max()
+        highlight_amt = np.nanmax(np.abs(anomalies["amount"].to_numpy()))
         highlights.append(
             f"Foram encontrados {len(anomalies)} gastos atipicos (valor maximo aproximado R$ {highlight_amt:.2f})."
         )
     if quality is not None and not quality.monthly_summary.empty:
-        flagged = quality.monthly_summary.query("quality_flag == True")
+        summary = quality.monthly_summary
+        flagged = summary[summary["quality_flag"].to_numpy(dtype=bool)]
         if not flagged.empty:
             month_col = flagged["month"]
             if pd.api.types.is_datetime64_any_dtype(month_col):
@@ -114,12 +125,15 @@ def generate_insight_report(
     config: FinanceAIConfig | None = None,
 ) -> InsightReport:
     cfg = config or get_default_config()
-    breakdown = _build_category_breakdown(dataframe)
-    recurring = _find_recurring_merchants(dataframe)
-    metrics = _cashflow_metrics(dataframe, cfg)
-    highlights = _build_highlights(dataframe, breakdown, metrics, forecast, quality)
-    anomaly_table = dataframe.query("is_anomaly == True").copy()
-    anomaly_table = anomaly_table.sort_values("anomaly_score")
+    # every helper works off these two views instead of re-querying the frame
+    expense_mask = (dataframe["transaction_type"] == "expense").to_numpy()
+    expenses = dataframe[expense_mask]
+    anomalies = dataframe[dataframe["is_anomaly"].to_numpy(dtype=bool)]
+    breakdown = _build_category_breakdown(expenses)
+    recurring = _find_recurring_merchants(expenses)
+    metrics = _cashflow_metrics(dataframe, expenses, expense_mask, cfg)
+    highlights = _build_highlights(anomalies, breakdown, metrics, forecast, quality)
+    anomaly_table = anomalies.sort_values("anomaly_score")
     quality_summary = quality.monthly_summary if quality is not None else pd.DataFrame()
     headline = "Panorama financeiro consolidado"
     return InsightReport(
@@ -9,9 +9,10 @@ from typing import Optional, Sequence
 import pandas as pd
 
 try:  # pragma: no cover - import guard for script execution
+    from . import _artifact_cache
     from .anomaly_detection import AnomalyResult, detect_anomalies
     from .config import FinanceAIConfig, get_default_config
-    from .data_loader import load_transactions
+    from .data_loader import _resolve_sources, load_transactions
     from .data_quality import DataQualityResult, assess_data_quality
     from .feature_engineering import engineer_features
     from .forecasting import ForecastResult, forecast_expenses
@@ -25,9 +26,10 @@ except ImportError:  # executed as a stand-alone script
     if str(PACKAGE_ROOT.parent) not in sys.path:
         sys.path.append(str(PACKAGE_ROOT.parent))
 
+    from finance_ai import _artifact_cache  # type: ignore
     from finance_ai.anomaly_detection import AnomalyResult, detect_anomalies  # type: ignore
     from finance_ai.config import FinanceAIConfig, get_default_config  # type: ignore
-    from finance_ai.data_loader import load_transactions  # type: ignore
+    from finance_ai.data_loader import _resolve_sources, load_transactions  # type: ignore
     from finance_ai.data_quality import DataQualityResult, assess_data_quality  # type: ignore
     from finance_ai.feature_engineering import engineer_features  # type: ignore
     from finance_ai.forecasting import ForecastResult, forecast_expenses  # type: ignore
@@ -51,15 +53,24 @@ def run_analysis(
     dataframe: Optional[pd.DataFrame] = None,
     *,
     config: Optional[FinanceAIConfig] = None,
+    use_cache: bool = True,
 ) -> AnalysisArtifacts:
     cfg = config or get_default_config()
-    if dataframe is not None:
-        raw = dataframe.copy()
+    # statement files are keyed by path, mtime and size; in-memory frames are not cached
+    cache_dir = None
+    cached = None
+    if dataframe is None and use_cache:
+        cache_dir = _artifact_cache.entry_dir(_resolve_sources(sources, cfg), cfg)
+        cached = _artifact_cache.load(cache_dir)
+    if cached is not None:
+        raw, processed, features, anomalies = cached
     else:
-        raw = load_transactions(sources, config=cfg)
-    processed = prepare_transactions(raw, config=cfg)
-    features = engineer_features(processed, config=cfg)
-    anomalies = detect_anomalies(features, config=cfg)
+        raw = dataframe if dataframe is not None else load_transactions(sources, config=cfg)
+        processed = prepare_transactions(raw, config=cfg)
+        features = engineer_features(processed, config=cfg)
+        anomalies = detect_anomalies(features, config=cfg)
+        if cache_dir is not None:
+            _artifact_cache.store(cache_dir, raw, processed, features, anomalies)
     quality = assess_data_quality(anomalies.dataframe, config=cfg)
     forecast = forecast_expenses(anomalies.dataframe, config=cfg)
     insights = generate_insight_report(
@@ -93,6 +104,18 @@ def _create_argument_parser() -> argparse.ArgumentParser:
         metavar="ARQUIVO",
         help="Exporta as transacoes processadas para CSV",
     )
+    parser.add_argument(
+        "--no-cache",
+        dest="use_cache",
+        action="store_false",
+        help="Reprocessa os arquivos mesmo que haja resultados em cache",
+    )
+    parser.add_argument(
+        "--clear-cache",
+        dest="clear_cache",
+        action="store_true",
+        help="Apaga os resultados em cache antes de processar",
+    )
     return parser
 
 
@@ -130,7 +153,9 @@ def _render_console_report(artifacts: AnalysisArtifacts) -> None:
 def main(argv: Optional[Sequence[str]] = None) -> None:
     parser = _create_argument_parser()
     args = parser.parse_args(argv)
-    artifacts = run_analysis(args.paths or None)
+    if args.clear_cache:
+        _artifact_cache.clear(get_default_config())
+    artifacts = run_analysis(args.paths or None, use_cache=args.use_cache)
     _render_console_report(artifacts)
     if args.export:
         export_path = args.export
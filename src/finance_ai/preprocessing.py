@@ -1,26 +1,29 @@
-"""Preprocessing routines for credit card statements."""
+"""Preprocessing routines for credit card statements.
+
+``amount`` and ``running_balance`` stay float64: they are currency values
+that feed totals, and float32 stops resolving cents above roughly R$ 100k.
+``abs_amount`` is only ever a model input and is stored as float32.
+"""
 
 from __future__ import annotations
 
-from typing import Tuple
+from typing import Optional
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from ._categorize_nb import categorize_descriptions
+from .config import TRANSACTION_TYPES, FinanceAIConfig, get_default_config
 
-from .config import FinanceAIConfig, get_default_config
 
+def _matches_pattern(descriptions_lower: pa.Array, pattern: Optional[str]) -> np.ndarray:
+	"""One RE2 pass over the whole array; ``pattern`` is a keyword alternation."""
 
-def _classify_transaction(
-	description: str,
-	amount: float,
-	config: FinanceAIConfig,
-) -> Tuple[str, float]:
-	abs_amount = abs(amount)
-	if config.is_income(description, amount):
-		return "income", abs_amount
-	if config.is_refund(description, amount):
-		return "refund", abs_amount
-	return "expense", -abs_amount
+	if pattern is None:
+		return np.zeros(len(descriptions_lower), dtype=bool)
+	return pc.match_substring_regex(descriptions_lower, pattern).to_numpy(zero_copy_only=False)
 
 
 def prepare_transactions(
@@ -29,37 +32,67 @@ def prepare_transactions(
 	config: FinanceAIConfig | None = None,
 ) -> pd.DataFrame:
 	cfg = config or get_default_config()
-	df = dataframe.copy()
+	# shallow: under Copy-on-Write the caller's buffers are shared, never written
+	df = dataframe.copy(deep=False)
 	df[cfg.date_column] = pd.to_datetime(df[cfg.date_column], errors="coerce")
 	df = df.dropna(subset=[cfg.date_column])
 	df[cfg.description_column] = df[cfg.description_column].fillna("Desconhecido").astype(str)
 	df[cfg.amount_column] = df[cfg.amount_column].astype(float)
 
-	classification = df.apply(
-		lambda row: _classify_transaction(
-			row[cfg.description_column],
-			row[cfg.amount_column],
-			cfg,
-		),
-		axis=1,
-		result_type="expand",
+	# string work runs on Arrow kernels instead of per-row Python str methods
+	descriptions_arrow = pa.array(df[cfg.description_column], type=pa.string())
+	lowered = pc.utf8_lower(descriptions_arrow)
+	amounts = df[cfg.amount_column].to_numpy()
+	abs_amounts = np.abs(amounts)
+	# same precedence as FinanceAIConfig.is_income / is_refund: negative amounts are income
+	income_mask = (amounts < 0) | _matches_pattern(lowered, cfg.income_pattern)
+	refund_mask = ~income_mask & _matches_pattern(lowered, cfg.refund_pattern)
+	type_codes = np.select(
+		[income_mask, refund_mask],
+		[TRANSACTION_TYPES.index("income"), TRANSACTION_TYPES.index("refund")],
+		default=TRANSACTION_TYPES.index("expense"),
 	)
-	df["transaction_type"] = classification[0]
-	df["signed_amount"] = classification[1]
-	df["amount"] = df["signed_amount"]
+	df["transaction_type"] = pd.Categorical.from_codes(type_codes, categories=TRANSACTION_TYPES)
+	df["amount"] = np.where(income_mask | refund_mask, abs_amounts, -abs_amounts)
 
-	df["category"] = df[cfg.description_column].apply(cfg.category_for_description)
-	df["is_subscription"] = df[cfg.description_column].str.lower().apply(cfg.is_subscription)
-	df["abs_amount"] = df["amount"].abs()
-	df["day_of_week"] = df[cfg.date_column].dt.dayofweek
-	df["is_weekend"] = df["day_of_week"].isin([5, 6]).astype(int)
-	df["date_only"] = df[cfg.date_column].dt.date
-	df["month"] = df[cfg.date_column].dt.to_period("M").dt.to_timestamp()
-	df["year"] = df[cfg.date_column].dt.year
-	df["hour"] = df[cfg.date_column].dt.hour.fillna(0).astype(int)
-	df["merchant_clean"] = df[cfg.description_column].str.replace(r"[^a-zA-Z0-9 ]", "", regex=True).str.strip()
+	# low-cardinality labels groupby and compare on integer codes as categoricals
+	df["category"] = pd.Categorical(categorize_descriptions(lowered, cfg, lowered=True))
+	df["is_subscription"] = _matches_pattern(lowered, cfg.subscription_pattern)
+	df["abs_amount"] = abs_amounts.astype(np.float32)
+	# every calendar field comes from the one datetime64 array (NaT rows were
+	# dropped above); unit casts floor, so pre-1970 dates come out right too
+	dates = df[cfg.date_column]
+	if isinstance(dates.dtype, pd.DatetimeTZDtype):
+		# calendar fields follow the local wall time, as the .dt accessors do
+		dates = dates.dt.tz_localize(None)
+	timestamps = dates.to_numpy()
+	days = timestamps.astype("datetime64[D]")
+	epoch_days = days.view(np.int64)
+	# 1970-01-01 was a Thursday, i.e. day 3 with Monday as 0
+	day_of_week = ((epoch_days + 3) % 7).astype(np.int8)
+	df["day_of_week"] = day_of_week
+	df["is_weekend"] = (day_of_week >= 5).astype(np.int8)
+	# datetime64 midnight keys hash as int64, unlike datetime.date objects
+	df["date_only"] = days.astype(timestamps.dtype)
+	df["month"] = timestamps.astype("datetime64[M]").astype(timestamps.dtype)
+	df["year"] = (timestamps.astype("datetime64[Y]").view(np.int64) + 1970).astype(np.int32)
+	df["hour"] = ((timestamps - days) // np.timedelta64(1, "h")).astype(np.int8)
+	merchants = pc.utf8_trim_whitespace(pc.replace_substring_regex(descriptions_arrow, r"[^a-zA-Z0-9 ]", ""))
+	df["merchant_clean"] = pd.Categorical(merchants.to_numpy(zero_copy_only=False))
 
-	df = df.sort_values(cfg.date_column).reset_index(drop=True)
-	df = df.drop(columns=["signed_amount"], errors="ignore")
-	df["running_balance"] = df["amount"].cumsum()
+	# one stable argsort over the int64 instants (UTC for tz-aware dates) taken
+	# once for every column; rows sharing a date keep their statement order
+	order = np.argsort(df[cfg.date_column].array.asi8, kind="stable")
+	df = df.take(order)
+	df.index = pd.RangeIndex(len(df))
+	amounts = df["amount"].to_numpy()
+	running_balance = np.empty_like(amounts)
+	missing = np.isnan(amounts)
+	if missing.any():
+		# Series.cumsum semantics: missing amounts are skipped and stay NaN
+		np.cumsum(np.where(missing, 0.0, amounts), out=running_balance)
+		running_balance[missing] = np.nan
+	else:
+		np.cumsum(amounts, out=running_balance)
+	df["running_balance"] = running_balance
 	return df
@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
-import plotly.express as px  # type: ignore
 import plotly.graph_objects as go  # type: ignore
 
 try:
@@ -13,31 +13,31 @@ except ImportError:  # executed as top-level script
 
 
 def spending_over_time(dataframe: pd.DataFrame) -> go.Figure:
-    daily = (
-        dataframe
-        .query("transaction_type == 'expense'")
-        .groupby("date_only")["amount"]
-        .sum()
-        .mul(-1)
-        .reset_index(name="daily_spend")
-    )
-    fig = px.line(
-        daily,
-        x="date_only",
-        y="daily_spend",
+    expense_mask = (dataframe["transaction_type"] == "expense").to_numpy()
+    days = dataframe["date_only"].to_numpy()[expense_mask]
+    amounts = dataframe["amount"].to_numpy(dtype=float)[expense_mask]
+    # per-day totals straight from the arrays instead of a groupby/reset_index frame
+    unique_days, day_codes = np.unique(days, return_inverse=True)
+    daily_spend = -np.bincount(day_codes, weights=np.where(np.isnan(amounts), 0.0, amounts))
+    fig = go.Figure(go.Scatter(x=unique_days, y=daily_spend, mode="lines", name="Gasto"))
+    fig.update_layout(
         title="Gastos diários",
-        labels={"date_only": "Data", "daily_spend": "Gasto (R$)"},
+        xaxis_title="Data",
+        yaxis_title="Gasto (R$)",
     )
     return fig
 
 
 def category_breakdown_chart(breakdown: pd.DataFrame) -> go.Figure:
-    fig = px.treemap(
-        breakdown,
-        path=["category"],
-        values="total",
-        title="Distribuição de gastos por categoria",
+    labels = breakdown["category"].astype(str).to_numpy()
+    fig = go.Figure(
+        go.Treemap(
+            labels=labels,
+            parents=np.full(len(labels), ""),
+            values=breakdown["total"].to_numpy(),
+        )
     )
+    fig.update_layout(title="Distribuição de gastos por categoria")
     return fig
 
 
@@ -71,17 +71,37 @@ def forecast_chart(result: ForecastResult) -> go.Figure:
 
 
 def anomaly_scatter(dataframe: pd.DataFrame) -> go.Figure:
-    anomalies = dataframe.query("is_anomaly == True")
+    anomalies = dataframe[dataframe["is_anomaly"].to_numpy(dtype=bool)]
     if anomalies.empty:
         fig = go.Figure()
         fig.update_layout(title="Nenhum gasto atípico identificado")
         return fig
-    fig = px.scatter(
-        anomalies,
-        x="date",
-        y="amount",
-        color="category",
-        hover_data=["merchant_clean", "anomaly_score", "source_file"],
+    # one WebGL trace per category keeps the legend without px's build step
+    hover_columns = ["merchant_clean", "anomaly_score", "source_file"]
+    hover = np.column_stack([anomalies[column].to_numpy(dtype=object) for column in hover_columns])
+    hovertemplate = "date=%{x}<br>amount=%{y}" + "".join(
+        f"<br>{column}=%{{customdata[{position}]}}" for position, column in enumerate(hover_columns)
+    )
+    dates = anomalies["date"].to_numpy()
+    amounts = anomalies["amount"].to_numpy()
+    codes, categories = pd.factorize(anomalies["category"], sort=True)
+    fig = go.Figure()
+    for code, category in enumerate(categories):
+        rows = codes == code
+        fig.add_trace(
+            go.Scattergl(
+                x=dates[rows],
+                y=amounts[rows],
+                mode="markers",
+                name=str(category),
+                customdata=hover[rows],
+                hovertemplate=hovertemplate,
+            )
+        )
+    fig.update_layout(
         title="Transações atípicas",
+        xaxis_title="date",
+        yaxis_title="amount",
+        legend_title_text="category",
     )
     return fig
\ No newline at end of file